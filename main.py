@@ -1,14 +1,17 @@
 from threading import Thread
 
 from services.static import StaticFilesTraversalService
-from utils.comparison import get_dir_hashes, get_content_hash, compare_hashes
-from utils.filemanager import ClearData, SaveToCsvFile, SaveToJsonFile
+from utils.comparison import get_dir_hashes, get_content_hash
+from utils.digests import DigestMatrix
+from utils.filemanager import ClearData, SaveToCsvFile, SaveToJsonFile, NdjsonStream
 from utils.git_functions import get_commits, get_all_tags, get_target_dir, clone_repository, change_commit, \
-    get_all_commits, get_next_commit
+    get_next_commit, get_commit_dates, get_tags_by_commit
 from utils.parser import InitParser
 
 
 THREADS_AMOUNT = 10
+# Number of closest commits shown when there are no actual commits
+CLOSEST_COMMITS_AMOUNT = 5
 
 # List of all commits
 all_commits_list = []
@@ -21,19 +24,60 @@ actual_commits = []
 commits_amount = 0
 commits_processed = 0
 
-def process_commits_thread(thread_number, commits_list, target_dir, extensions, site_hashes):
+# Stream for NDJSON results (None if streaming is disabled)
+ndjson_stream = None
+# Dates and tags of all commits for NDJSON records
+commit_dates = {}
+commit_tags = {}
+
+
+def stream_commit(commit, matched_files, site_files, commit_files):
+    '''
+    Writing an actual commit to the NDJSON stream.
+
+    :param commit: Actual commit
+    :param matched_files: Number of site files matched in the commit
+    :param site_files: Total number of unique site files
+    :param commit_files: Number of tracked files in the commit
+    '''
+
+    ndjson_stream.write_commit(
+        commit,
+        commit_dates.get(commit, ''),
+        commit_tags.get(commit, []),
+        matched_files,
+        site_files,
+        commit_files
+    )
+
+
+def get_unchanged_commits(commit):
+    '''
+    Getting the commits following the given one where target folder hasn't been modified.
+
+    :param commit: Commit where target folder has been modified
+    :return: List of commits with the same target folder content.
+    '''
+
+    unchanged_commits = []
+    next_commit = get_next_commit(all_commits_list, commit)
+    while next_commit is not None and next_commit not in commits_list:
+        unchanged_commits.append(next_commit)
+        next_commit = get_next_commit(all_commits_list, next_commit)
+    return unchanged_commits
+
+
+def process_commits_thread(thread_number, commits_list, target_dir, extensions, digest_matrix):
     '''
-    Processing commits in a separate thread and adding actual commits to the list of actual commits.
+    Processing commits in a separate thread and marking matched site files in the digest matrix.
 
     :param thread_number: Thread number
     :param commits_list: List of commits
     :param target_dir: Target directory in git repository
     :param extensions: Tracked static files extensions
-    :param site_hashes: List of hashes of static site files
+    :param digest_matrix: Matrix of site and commit file digests
     '''
 
-    global all_commits_list
-    global actual_commits
     global commits_amount
     global commits_processed
 
@@ -60,14 +104,14 @@ def process_commits_thread(thread_number, commits_list, target_dir, extensions,
         # Getting a list of commit file hashes
         commit_hashes = get_dir_hashes(repo_path + '\\' + target_dir, extensions)
 
-        # Comparing a list of file hashes from a website and a commit
-        if compare_hashes(site_hashes, commit_hashes):
-            actual_commits.append(commit)
-            # Adding commits where target folder hasn't been modified
-            next_commit = get_next_commit(all_commits_list, commit)
-            while next_commit != '' and next_commit not in commits_list:
-                actual_commits.append(next_commit)
-                next_commit = get_next_commit(all_commits_list, next_commit)
+        # Marking site files found in the commit for matching all commits at once
+        matched_files = digest_matrix.add_commit(commit, commit_hashes)
+
+        # Streaming an actual commit right away, without waiting for the whole history
+        if ndjson_stream is not None and matched_files == digest_matrix.site_size:
+            # Commits where target folder hasn't been modified have the same files
+            for actual_commit in [commit] + get_unchanged_commits(commit):
+                stream_commit(actual_commit, matched_files, digest_matrix.site_size, len(commit_hashes))
 
         # Show progress
         commits_processed += 1
@@ -126,9 +170,13 @@ def main():
 
     print('Getting a list of commits...')
 
-    # Getting lists of commits
+    # Getting lists of commits with their dates and tags
+    global commit_dates
+    commit_dates = get_commit_dates(f'.data\\git_files_0')
+    global commit_tags
+    commit_tags = get_tags_by_commit(f'.data\\git_files_0')
     global all_commits_list
-    all_commits_list = get_all_commits(f'.data\\git_files_0')
+    all_commits_list = list(commit_dates)
     global commits_list
     commits_list = get_commits(f'.data\\git_files_0', args.dir)
     global commits_amount
@@ -139,10 +187,18 @@ def main():
     # List of actual commits
     global actual_commits
 
+    # Streaming actual commits to NDJSON as they are found
+    global ndjson_stream
+    if args.ndjson:
+        ndjson_stream = NdjsonStream()
+
+    # Matrix of site and commit file digests
+    digest_matrix = DigestMatrix(site_hashes, commits_list)
+
     # Iterating through commits in separate threads
     threads = []
     for thread_number in range(THREADS_AMOUNT):
-        thread = Thread(target=process_commits_thread, args=(thread_number, commits_list, args.dir,extensions, site_hashes,))
+        thread = Thread(target=process_commits_thread, args=(thread_number, commits_list, args.dir,extensions, digest_matrix,))
         threads.append(thread)
         thread.start()
 
@@ -151,6 +207,21 @@ def main():
         thread.join()
     print()     # After progress display
 
+    # Comparing file digests from a website and all commits in one pass
+    matrix_commits, coverage, matched = digest_matrix.match()
+    for commit, is_actual in zip(matrix_commits, matched):
+        if is_actual:
+            actual_commits.append(commit)
+            # Adding commits where target folder hasn't been modified
+            actual_commits.extend(get_unchanged_commits(commit))
+
+    # Showing the closest commits when no commit contains all site files
+    if not actual_commits and len(matrix_commits):
+        print()
+        print('No commit contains all site files. Closest commits:')
+        for index in (-coverage).argsort(kind='stable')[:CLOSEST_COMMITS_AMOUNT]:
+            print(f'{matrix_commits[index]}: {coverage[index]}/{digest_matrix.site_size} site files')
+
     print('Getting actual tags from actual commits...')
 
     # Getting actual tags from actual commits
@@ -174,6 +245,8 @@ def main():
         SaveToCsvFile(actual_commits, actual_tags)
     if args.json:
         SaveToJsonFile(actual_commits, actual_tags)
+    if ndjson_stream is not None:
+        ndjson_stream.write_summary(actual_commits, actual_tags, commits_processed)
 
     print('The program is completed!')
 
@@ -183,5 +256,8 @@ if __name__ == '__main__':
     except Exception as e:
         print(f'An error has occurred: {e}')
     finally:
+        # Closing the NDJSON stream
+        if ndjson_stream is not None:
+            ndjson_stream.close()
         # Deleting folders with git repository data
         ClearData('.data')
\ No newline at end of file
@@ -43,9 +43,4 @@ def get_dir_hashes(directory_path, extensions=()):
             file_hash = get_file_hash(path)
             file_hashes.append(file_hash)
 
-    return file_hashes
-
-
-# list comparison
-def compare_hashes(site_hashes, repo_hashes):
-    return set(site_hashes).issubset(repo_hashes)
\ No newline at end of file
+    return file_hashes
\ No newline at end of file
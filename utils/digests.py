@@ -0,0 +1,85 @@
+import numpy as np
+
+
+# Size of a sha3_256 digest in bytes
+DIGEST_SIZE = 32
+
+# Fixed-width numpy type for storing a single digest
+DIGEST_DTYPE = np.dtype(f'V{DIGEST_SIZE}')
+
+
+def hashes_to_digests(hashes):
+    '''
+    Converting hex hashes to a sorted array of unique fixed-width digests.
+
+    :param hashes: List of hashes as hex strings
+    :return: Sorted numpy array of unique digests.
+    '''
+
+    digests = np.frombuffer(bytes.fromhex(''.join(hashes)), dtype=DIGEST_DTYPE)
+    return np.unique(digests)
+
+
+class DigestMatrix:
+    '''
+    Matrix of commits × site files, where each commit is stored as a bitset over the site file digests.
+    '''
+
+    def __init__(self, site_hashes, commits):
+        '''
+        Making a matrix for the given site files and commits.
+
+        :param site_hashes: List of hashes of static site files
+        :param commits: List of commits, rows of the matrix follow its order
+        '''
+
+        self.site_digests = hashes_to_digests(site_hashes)
+
+        self.commits = list(commits)
+        self.commit_rows = {commit: row for row, commit in enumerate(self.commits)}
+
+        # One bit per site file for each commit
+        self.bitsets = np.zeros((len(self.commits), (self.site_size + 7) // 8), dtype=np.uint8)
+
+    @property
+    def site_size(self):
+        '''
+        Number of unique site files.
+        '''
+
+        return len(self.site_digests)
+
+    def add_commit(self, commit, hashes):
+        '''
+        Marking site files found among commit file hashes.
+
+        :param commit: Commit hash
+        :param hashes: List of hashes of commit files
+        :return: Number of matched site files.
+        '''
+
+        found = np.zeros(self.site_size, dtype=bool)
+
+        if self.site_size:
+            digests = hashes_to_digests(hashes)
+
+            # Positions of commit digests in the sorted array of site digests
+            positions = np.searchsorted(self.site_digests, digests)
+            positions[positions == self.site_size] = 0
+            found[positions[self.site_digests[positions] == digests]] = True
+
+        # Each thread writes only rows of its own commits
+        self.bitsets[self.commit_rows[commit]] = np.packbits(found)
+
+        return int(np.count_nonzero(found))
+
+    def match(self):
+        '''
+        Matching all commits against site files in one pass.
+
+        :return: List of commits, per-commit coverage counts and mask of commits containing all site files.
+        '''
+
+        coverage = np.unpackbits(self.bitsets, axis=1, count=self.site_size).sum(axis=1, dtype=np.int64)
+
+        return self.commits, coverage, coverage == self.site_size
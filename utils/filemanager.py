@@ -2,6 +2,7 @@ import csv
 import json
 import re
 import subprocess
+from threading import Lock
 
 
 def RemoveSpecSymbols(content):
@@ -65,4 +66,80 @@ def SaveToJsonFile(commits, tags):
     }
 
     with open('output.json', 'w', encoding='utf-8') as file:
-        json.dump(data, file, ensure_ascii=False, indent=4)
\ No newline at end of file
+        json.dump(data, file, ensure_ascii=False, indent=4)
+
+
+class NdjsonStream:
+    '''
+    Streaming results to an NDJSON file: one JSON record per line, written as soon as it is available.
+    '''
+
+    def __init__(self, file_path='output.ndjson'):
+        '''
+        Opening an NDJSON file for writing.
+
+        :param file_path: Path to the output file
+        '''
+
+        self.file = open(file_path, 'w', encoding='utf-8')
+
+        # Records are written from several threads
+        self.lock = Lock()
+
+    def write(self, record):
+        '''
+        Writing a single record and flushing it so that readers can consume it immediately.
+
+        :param record: Dictionary with record data
+        '''
+
+        line = json.dumps(record, ensure_ascii=False)
+        with self.lock:
+            self.file.write(line + '\n')
+            self.file.flush()
+
+    def write_commit(self, commit, date, tags, matched_files, site_files, commit_files):
+        '''
+        Writing a record about an actual commit.
+
+        :param commit: Commit hash
+        :param date: Commit date in ISO 8601 format
+        :param tags: List of commit tags
+        :param matched_files: Number of site files matched in the commit
+        :param site_files: Total number of unique site files
+        :param commit_files: Number of tracked files in the commit
+        '''
+
+        self.write({
+            "type": "commit",
+            "commit": commit,
+            "date": date,
+            "tags": tags,
+            "matched_files": matched_files,
+            "site_files": site_files,
+            "commit_files": commit_files
+        })
+
+    def write_summary(self, commits, tags, commits_processed):
+        '''
+        Writing the final summary record.
+
+        :param commits: List of actual commits
+        :param tags: List of actual tags
+        :param commits_processed: Number of processed commits
+        '''
+
+        self.write({
+            "type": "summary",
+            "commits": commits,
+            "tags": tags,
+            "commits_processed": commits_processed
+        })
+
+    def close(self):
+        '''
+        Closing the output file.
+        '''
+
+        with self.lock:
+            self.file.close()
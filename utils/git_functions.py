@@ -98,6 +98,43 @@ def change_commit(commit, repo_dir):
         print(f"Ошибка при выполнении команды checkout: {error}")
 
 
+def get_commit_dates(repo_dir):
+    """Функция получения дат всех коммитов в формате ISO 8601 (в порядке истории)"""
+    try:
+        result = subprocess.run(
+            ["git", "-C", repo_dir, "log", "--format=%H %cI"],
+            capture_output=True, text=True, check=True
+        )
+        commit_dates = {}
+        for line in result.stdout.strip().split("\n"):
+            if line:
+                commit, date = line.split(" ", 1)
+                commit_dates[commit] = date
+        return commit_dates
+    except subprocess.CalledProcessError as error:
+        print(f"Ошибка при получении дат коммитов: {error}")
+        return {}
+
+
+def get_tags_by_commit(repo_dir):
+    """Функция получения тегов всех коммитов"""
+    try:
+        result = subprocess.run(
+            ["git", "-C", repo_dir, "for-each-ref", "--format=%(objectname) %(*objectname) %(refname:short)", "refs/tags"],
+            capture_output=True, text=True, check=True
+        )
+        tags_by_commit = {}
+        for line in result.stdout.strip().split("\n"):
+            if line:
+                # Для аннотированных тегов коммит указан во втором поле
+                object_name, commit, tag = line.split(" ", 2)
+                tags_by_commit.setdefault(commit or object_name, []).append(tag)
+        return tags_by_commit
+    except subprocess.CalledProcessError as error:
+        print(f"Ошибка при получении тегов: {error}")
+        return {}
+
+
 def get_commit_tags(repo_dir, commit):
     """Функция получения тегов для определенного коммита"""
     try:
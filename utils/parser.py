@@ -21,4 +21,7 @@ def InitParser():
     # Optional argument - saving the result to a JSON file
     parser.add_argument("-j", "--json", action='store_true', help="Saving the result to a JSON file")
 
+    # Optional argument - streaming the result to an NDJSON file as matches are found
+    parser.add_argument("-n", "--ndjson", action='store_true', help="Streaming the result to an NDJSON file as matches are found")
+
     return parser
\ No newline at end of file